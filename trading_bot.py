@@ -1,163 +1,474 @@
 import os
 import logging
+import logging.handlers
+import atexit
+import queue
 import argparse
 import sys
 import time
-import numpy as np
+import math
+import functools
+import json
+import hmac
+import hashlib
+import asyncio
+from pathlib import Path
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from decimal import Decimal
 from binance.client import Client
 from binance import exceptions
 
+_STEP_EPS = 1e-9
+_HTTP_POOL_SIZE = 16
+# Open connections / in-flight signed requests per async run; kept low to stay
+# well inside Binance's 1200/min request weight
+_ASYNC_CONCURRENCY = 4
+_LOG_BUFFER_SIZE = 64 * 1024
+# Grids smaller than this are quantized in plain Python; numpy/numba import costs more
+_JIT_MIN_LEVELS = 256
+# Above this many orders per TWAP/Grid, per-order log lines drop to DEBUG
+_VERBOSE_ORDER_LIMIT = 50
+# Max orders Binance accepts per batchOrders call
+_BATCH_LIMIT = 5
+# On-disk copy of futures_exchange_info so new processes skip the download; kept in the
+# user's own cache dir, since anyone who can write it controls how orders are rounded
+_EXINFO_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'trading_bot'
+_EXINFO_TTL = 6 * 3600
+
+
+def _step_entry(step: str):
+    # (step, 1/step, decimals) so quantizing multiplies instead of divides
+    dec_step = Decimal(step)
+    if not dec_step:
+        return None
+    decimals = max(0, -dec_step.normalize().as_tuple().exponent)
+    return float(dec_step), float(1 / dec_step), decimals
+
+
+def _quantize(values, out, step, inv_step):
+    # numba kernel source, compiled by _quantize_kernel(); must stay outside the class
+    for i in range(values.size):
+        out[i] = math.floor(values[i] * inv_step + _STEP_EPS) * step
+
+
+@functools.lru_cache(maxsize=None)
+def _quantize_kernel():
+    # numpy/numba are optional and slow to import, so only load them for the first large grid
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    return np, njit('void(float64[:], float64[:], float64, float64)', cache=True)(_quantize)
+
+
+def _quantize_prices(prices: list, step: float, inv_step: float, decimals: int) -> list:
+    kernel = _quantize_kernel() if len(prices) >= _JIT_MIN_LEVELS else None
+    if kernel is None:
+        return [round(math.floor(p * inv_step + _STEP_EPS) * step, decimals) for p in prices]
+    np, quantize = kernel
+    values = np.asarray(prices, dtype=np.float64)
+    out = np.empty_like(values)
+    quantize(values, out, step, inv_step)
+    return np.round(out, decimals).tolist()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    # Opens the file on first record and batches writes in a 64 KB buffer;
+    # StreamHandler would otherwise flush after every line.
+    def __init__(self, filename: str, buffer_size: int = _LOG_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._in_emit = False
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        # Only skips the flush StreamHandler.emit does per record; explicit flushes still go through
+        with self.lock:
+            if not self._in_emit:
+                super().flush()
+
+    def emit(self, record):
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+        # ERRORs and end-of-run records (extra={'flush': True}) hit the disk right away
+        if record.levelno >= logging.ERROR or getattr(record, 'flush', False):
+            self.flush()
+
+
+def _build_market(s: str, side_u: str, qty: float, price: float, stop_price: float) -> dict:
+    return {'symbol': s, 'side': side_u, 'type': 'MARKET', 'quantity': qty}
+
+
+def _build_limit(s: str, side_u: str, qty: float, price: float, stop_price: float) -> dict:
+    return {
+        'symbol': s,
+        'side': side_u,
+        'type': 'LIMIT',
+        'price': price,
+        'quantity': qty,
+        'timeInForce': 'GTC'
+    }
+
+
+def _build_stop_limit(s: str, side_u: str, qty: float, price: float, stop_price: float) -> dict:
+    return {
+        'symbol': s,
+        'side': side_u,
+        'type': 'STOP',
+        'price': price,
+        'stopPrice': stop_price,
+        'quantity': qty,
+        'timeInForce': 'GTC'
+    }
+
+
+# Inputs each order type/strategy can't run without, checked before any request is sent
+_REQUIRED_FIELDS = {
+    'LIMIT': ('price',),
+    'STOP_LIMIT': ('price', 'stop_price'),
+    'TWAP': ('duration', 'intervals'),
+    'GRID': ('lower_price', 'upper_price', 'grids'),
+}
+
+
+def _require(order_type: str, **fields):
+    missing = [f for f in _REQUIRED_FIELDS.get(order_type, ()) if fields.get(f) is None]
+    if missing:
+        raise ValueError(f"{order_type} requires {', '.join(missing)}")
+
+
+def failed_orders(results: list) -> list:
+    # Grid results keep a slot per level: an exception, or a batch {'code', 'msg'} rejection
+    return [r for r in results if isinstance(r, Exception) or (isinstance(r, dict) and 'code' in r)]
+
+
+_ORDER_BUILDERS = {
+    'MARKET': _build_market,
+    'LIMIT': _build_limit,
+    'STOP_LIMIT': _build_stop_limit,
+}
+
+
 class BasicBot:
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    _BASE_URL = 'https://fapi.binance.com'
+    _TESTNET_BASE_URL = 'https://testnet.binancefuture.com'
+
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True,
+                 exinfo_ttl: float = _EXINFO_TTL):
         self.client = Client(api_key, api_secret, testnet=testnet)
-        info = self.client.futures_exchange_info()
-        self.filters = {f['symbol']: f['filters'] for f in info['symbols']}
-        
+        # Keep-alive pool for the sync client, with backoff on
+        # throttling/5xx. POST is not retried: a resent order could be placed twice.
+        # raise_on_status=False hands the final error response to python-binance's handling.
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset(['GET', 'DELETE']), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE,
+                              max_retries=retry)
+        self.client.session.mount('https://', adapter)
+        self.client.session.headers['Connection'] = 'keep-alive'
+        self._api_key = api_key
+        # Secret pre-encoded once for HMAC signing of raw async requests
+        self._hmac_key = api_secret.encode()
+        self._base_url = self._TESTNET_BASE_URL if testnet else self._BASE_URL
+        info = self._load_exchange_info(testnet, exinfo_ttl)
+        # symbol -> filterType -> filter, so lookups don't scan the filter list
+        self.filters = {
+            f['symbol']: {flt['filterType']: flt for flt in f['filters']}
+            for f in info['symbols']
+        }
+        # Per-symbol {filterType: (step, inv_step, decimals)}, parsed once
+        self._steps = {}
+        for sym, sym_filters in self.filters.items():
+            lot = sym_filters.get('LOT_SIZE', {}).get('stepSize')
+            tick = sym_filters.get('PRICE_FILTER', {}).get('tickSize')
+            self._steps[sym] = {
+                'LOT_SIZE': _step_entry(lot) if lot else None,
+                'PRICE_FILTER': _step_entry(tick) if tick else None,
+            }
+
         # Configure logger (file + console) with idempotent setup
         self.logger = logging.getLogger('BasicBot')
-        self.logger.setLevel(logging.INFO)
-        if not getattr(self.logger, '_configured', False):
+        if not self.logger.handlers:
+            self.logger.setLevel(logging.INFO)
+            # Handlers below do all the output; don't re-emit through the root logger
+            self.logger.propagate = False
             fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            fh = logging.FileHandler('bot.log')
+            fh = _BufferedFileHandler('bot.log')
             fh.setFormatter(fmt)
             ch = logging.StreamHandler(sys.stdout)
             ch.setFormatter(fmt)
-            self.logger.addHandler(fh)
-            self.logger.addHandler(ch)
-            self.logger._configured = True
+            # Callers only enqueue records; a background thread does the file/console I/O
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, fh, ch, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger.info('Initialized BasicBot')
 
-    def _adjust_precision(self, symbol: str, value: float, filter_type: str) -> float:
-        sym_filters = self.filters.get(symbol.upper(), [])
-        for f in sym_filters:
-            if f['filterType'] == filter_type:
-                step = Decimal(f['stepSize'] if filter_type == 'LOT_SIZE' else f['tickSize'])
-                quant = (Decimal(value) // step) * step
-                return float(quant)
-        return value
+    def _load_exchange_info(self, testnet: bool, ttl: float) -> dict:
+        cache = _EXINFO_CACHE_DIR / f"binance_futures_exinfo{'_testnet' if testnet else ''}.json"
+        try:
+            # A future mtime gives a negative age; treat it as stale rather than never-expiring
+            if 0 <= time.time() - cache.stat().st_mtime < ttl:
+                return json.loads(cache.read_text())
+        except (OSError, ValueError):
+            pass
+        full = self.client.futures_exchange_info()
+        # Only symbol filters are used; the rest of the response isn't worth keeping
+        info = {'symbols': [{'symbol': f['symbol'], 'filters': f['filters']} for f in full['symbols']]}
+        try:
+            _EXINFO_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache.write_text(json.dumps(info))
+        except OSError:
+            pass
+        return info
+
+    def _adjust_precision(self, steps: dict, value: float, filter_type: str) -> float:
+        # steps is the caller's pre-resolved self._steps entry (None if the symbol is unknown)
+        entry = steps.get(filter_type) if steps else None
+        if entry is None:
+            return value
+        step, inv_step, decimals = entry
+        # Epsilon keeps exact multiples (e.g. 0.57 * 100 == 56.99999999999999) from dropping a step
+        return round(math.floor(value * inv_step + _STEP_EPS) * step, decimals)
 
     def _check_notional(self, symbol: str, quantity: float, price: float):
-        sym_filters = self.filters.get(symbol.upper(), [])
-        for f in sym_filters:
-            ft = f.get('filterType', '')
-            if ft in ('MIN_NOTIONAL', 'NOTIONAL'):
-                # Determine the correct key for min notional
-                if 'minNotional' in f:
-                    key = 'minNotional'
-                elif 'notional' in f:
-                    key = 'notional'
-                else:
-                    continue
-                min_notional = Decimal(f[key])
-                notional = Decimal(quantity) * Decimal(price)
-                if notional < min_notional:
-                    raise ValueError(
-                        f"Order notional {notional} is below minimum {min_notional}"
-                    )
-                break
+        sym_filters = self.filters.get(symbol, {})
+        f = sym_filters.get('MIN_NOTIONAL') or sym_filters.get('NOTIONAL')
+        if f is None:
+            return
+        # Determine the correct key for min notional
+        min_notional = f.get('minNotional', f.get('notional'))
+        if min_notional is None:
+            return
+        min_notional = Decimal(min_notional)
+        notional = Decimal(quantity) * Decimal(price)
+        if notional < min_notional:
+            raise ValueError(
+                f"Order notional {notional} is below minimum {min_notional}"
+            )
 
-    def place_order(self, symbol: str, side: str, order_type: str,
-                    quantity: float, price: float = None, stop_price: float = None):
-        s = symbol.upper()
-        qty = self._adjust_precision(s, quantity, 'LOT_SIZE')
-        # MARKET
-        if order_type == 'MARKET':
-            params = {'symbol': s, 'side': side.upper(), 'type': 'MARKET', 'quantity': qty}
-            endpoint = self.client.futures_create_order
-        # LIMIT
-        elif order_type == 'LIMIT':
-            if price is None:
-                raise ValueError('Price required for LIMIT orders')
-            pr = self._adjust_precision(s, price, 'PRICE_FILTER')
-            self._check_notional(s, qty, pr)
-            params = {
-                'symbol': s,
-                'side': side.upper(),
-                'type': 'LIMIT',
-                'price': pr,
-                'quantity': qty,
-                'timeInForce': 'GTC'
-            }
-            endpoint = self.client.futures_create_order
-        # STOP_LIMIT
-        elif order_type == 'STOP_LIMIT':
-            if price is None or stop_price is None:
-                raise ValueError('Both price and stop_price required')
-            pr = self._adjust_precision(s, price, 'PRICE_FILTER')
-            sp = self._adjust_precision(s, stop_price, 'PRICE_FILTER')
-            self._check_notional(s, qty, sp)
-            params = {
-                'symbol': s,
-                'side': side.upper(),
-                'type': 'STOP',
-                'price': pr,
-                'stopPrice': sp,
-                'quantity': qty,
-                'timeInForce': 'GTC'
-            }
-            endpoint = self.client.futures_create_order
-        else:
+    def _build_params(self, symbol: str, side: str, order_type: str,
+                      quantity: float, price: float = None, stop_price: float = None) -> dict:
+        try:
+            builder = _ORDER_BUILDERS[order_type]
+        except KeyError:
             raise ValueError(f'Unsupported order type: {order_type}')
+        _require(order_type, price=price, stop_price=stop_price)
+        s = symbol.upper()
+        side_u = side.upper()
+        steps = self._steps.get(s)
+        qty = self._adjust_precision(steps, quantity, 'LOT_SIZE')
+        pr = self._adjust_precision(steps, price, 'PRICE_FILTER') if price is not None else None
+        sp = self._adjust_precision(steps, stop_price, 'PRICE_FILTER') if stop_price is not None else None
+        params = builder(s, side_u, qty, pr, sp)
+        # Notional is checked against the trigger price for stops, the limit price otherwise
+        ref_price = params.get('stopPrice', params.get('price'))
+        if ref_price is not None:
+            self._check_notional(s, qty, ref_price)
+        return params
 
+    def place_order(self, symbol: str, side: str, order_type: str,
+                    quantity: float, price: float = None, stop_price: float = None,
+                    log_level: int = logging.INFO):
+        params = self._build_params(symbol, side, order_type, quantity, price, stop_price)
+        return self._submit(order_type, params, log_level)
+
+    def _submit(self, order_type: str, params: dict, log_level: int = logging.INFO):
         try:
-            self.logger.info(f"Placing {order_type} order with params: {params}")
-            return endpoint(**params)
-        except exceptions.BinanceAPIException as e:
-            self.logger.error(f"API error: {e.status_code} - {e.message}")
-            raise
+            self.logger.log(log_level, f"Placing {order_type} order with params: {params}")
+            return self.client.futures_create_order(**params)
         except Exception as e:
+            self._log_order_error(e)
+            raise
+
+    def _log_order_error(self, e: Exception):
+        if isinstance(e, exceptions.BinanceAPIException):
+            self.logger.error(f"API error: {e.status_code} - {e.message}")
+        else:
             self.logger.error(f"Unexpected error: {e}")
+
+    def _new_session(self) -> 'aiohttp.ClientSession':
+        # One keep-alive pool per async run: sessions are loop-bound and the bot may be
+        # shared (st.cache_resource) by runs on other threads, so none is kept on self.
+        # Imported here so the sync CLI/place_order path doesn't need or load aiohttp.
+        import aiohttp
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=_ASYNC_CONCURRENCY, keepalive_timeout=75))
+
+    async def _signed_post(self, session: 'aiohttp.ClientSession', path: str, params: dict) -> dict:
+        params = dict(params, timestamp=int(time.time() * 1000))
+        query = urlencode(params)
+        signature = hmac.new(self._hmac_key, query.encode(), hashlib.sha256).hexdigest()
+        url = f"{self._base_url}{path}?{query}&signature={signature}"
+        async with session.post(url, headers={'X-MBX-APIKEY': self._api_key}) as resp:
+            text = await resp.text()
+            if resp.status >= 400:
+                raise exceptions.BinanceAPIException(resp, resp.status, text)
+            return json.loads(text)
+
+    async def _place_order_async(self, session: 'aiohttp.ClientSession', symbol: str, side: str, order_type: str,
+                                 quantity: float, price: float = None, stop_price: float = None,
+                                 log_level: int = logging.INFO):
+        params = self._build_params(symbol, side, order_type, quantity, price, stop_price)
+        return await self._submit_async(session, order_type, params, log_level)
+
+    async def _submit_async(self, session: 'aiohttp.ClientSession', order_type: str, params: dict,
+                            log_level: int = logging.INFO):
+        try:
+            self.logger.log(log_level, f"Placing {order_type} order with params: {params}")
+            return await self._signed_post(session, '/fapi/v1/order', params)
+        except Exception as e:
+            self._log_order_error(e)
             raise
 
     def execute_twap(self, symbol: str, side: str, total_qty: float,
                      duration: int, intervals: int):
+        _require('TWAP', duration=duration, intervals=intervals)
         slice_qty = total_qty / intervals
         delay = duration / intervals
         results = []
+        log_level = logging.DEBUG if intervals > _VERBOSE_ORDER_LIMIT else logging.INFO
         self.logger.info(f"Starting TWAP: {intervals} slices, {slice_qty} qty each, every {delay}s")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        total_drift = max_drift = 0.0
+        # Slice i fires at start + i * delay, so submission latency doesn't stretch the window
+        start = time.monotonic()
         for i in range(intervals):
-            res = self.place_order(symbol, side, 'MARKET', slice_qty)
+            target = start + i * delay
+            now = time.monotonic()
+            if target > now:
+                time.sleep(target - now)
+            drift = time.monotonic() - target
+            total_drift += drift
+            max_drift = max(max_drift, drift)
+            if debug:
+                self.logger.debug(f"TWAP slice {i + 1}/{intervals} drift: {drift:.3f}s")
+            res = self.place_order(symbol, side, 'MARKET', slice_qty, log_level=log_level)
             results.append(res)
-            if i < intervals - 1:
-                time.sleep(delay)
+        self._finish_twap(intervals, total_drift, max_drift)
         return results
 
-    def execute_grid(self, symbol: str, side: str, total_qty: float,
-                     lower_price: float, upper_price: float, grids: int):
-        prices = np.linspace(lower_price, upper_price, grids)
-        qty_per_order = total_qty / grids
-        results = []
-        self.logger.info(f"Starting Grid: {grids} levels from {lower_price} to {upper_price}, {qty_per_order} each")
-        for price in prices:
-            res = self.place_order(symbol, side, 'LIMIT', qty_per_order, price=price)
-            results.append(res)
-        return results
+    def _finish_twap(self, intervals: int, total_drift: float, max_drift: float):
+        self.logger.info(f"TWAP finished: {intervals} slices, drift avg {total_drift / intervals:.3f}s, "
+                         f"max {max_drift:.3f}s", extra={'flush': True})
 
-    def execute_twap(self, symbol: str, side: str, total_qty: float,
-                     duration: int, intervals: int):
+    async def execute_twap_async(self, symbol: str, side: str, total_qty: float,
+                                 duration: int, intervals: int):
+        _require('TWAP', duration=duration, intervals=intervals)
         slice_qty = total_qty / intervals
         delay = duration / intervals
         results = []
-        self.logger.info(f"Starting TWAP: {intervals} slices, {slice_qty} qty each, every {delay}s")
-        for i in range(intervals):
-            res = self.place_order(symbol, side, 'MARKET', slice_qty)
-            results.append(res)
-            if i < intervals - 1:
-                time.sleep(delay)
+        log_level = logging.DEBUG if intervals > _VERBOSE_ORDER_LIMIT else logging.INFO
+        self.logger.info(f"Starting async TWAP: {intervals} slices, {slice_qty} qty each, every {delay}s")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        total_drift = max_drift = 0.0
+        async with self._new_session() as session:
+            # Slice i fires at start + i * delay, so a slow POST doesn't push back later slices
+            start = time.monotonic()
+            for i in range(intervals):
+                target = start + i * delay
+                now = time.monotonic()
+                if target > now:
+                    await asyncio.sleep(target - now)
+                drift = time.monotonic() - target
+                total_drift += drift
+                max_drift = max(max_drift, drift)
+                if debug:
+                    self.logger.debug(f"TWAP slice {i + 1}/{intervals} drift: {drift:.3f}s")
+                res = await self._place_order_async(session, symbol, side, 'MARKET', slice_qty,
+                                                    log_level=log_level)
+                results.append(res)
+        self._finish_twap(intervals, total_drift, max_drift)
         return results
 
-    def execute_grid(self, symbol: str, side: str, total_qty: float,
+    def _grid_prices(self, symbol: str, lower_price: float, upper_price: float, grids: int) -> list:
+        step = (upper_price - lower_price) / (grids - 1) if grids > 1 else 0.0
+        prices = [lower_price + i * step for i in range(grids)]
+        tick = (self._steps.get(symbol.upper()) or {}).get('PRICE_FILTER')
+        if tick:
+            prices = _quantize_prices(prices, *tick)
+        return prices
+
+    def _grid_orders(self, label: str, symbol: str, side: str, total_qty: float,
                      lower_price: float, upper_price: float, grids: int):
-        prices = np.linspace(lower_price, upper_price, grids)
+        _require('GRID', lower_price=lower_price, upper_price=upper_price, grids=grids)
+        s = symbol.upper()
         qty_per_order = total_qty / grids
-        results = []
-        self.logger.info(f"Starting Grid: {grids} levels from {lower_price} to {upper_price}, {qty_per_order} each")
-        for price in prices:
-            res = self.place_order(symbol, side, 'LIMIT', qty_per_order, price=price)
-            results.append(res)
+        log_level = logging.DEBUG if grids > _VERBOSE_ORDER_LIMIT else logging.INFO
+        self.logger.info(f"Starting {label}: {grids} levels from {lower_price} to {upper_price}, {qty_per_order} each")
+        # Prices come back tick-quantized in one pass, so levels are built without re-adjusting each one
+        prices = self._grid_prices(s, lower_price, upper_price, grids)
+        qty = self._adjust_precision(self._steps.get(s), qty_per_order, 'LOT_SIZE')
+        # Validated before anything is sent, so a bad level can't leave a partial grid; notional
+        # grows with price, so the lowest level is the only one that can miss the minimum
+        self._check_notional(s, qty, min(prices))
+        side_u = side.upper()
+        orders = [_build_limit(s, side_u, qty, p, None) for p in prices]
+        return orders, log_level
+
+    def _finish_grid(self, label: str, results: list) -> list:
+        # A failed level keeps its slot in results; the other levels may already be live orders
+        failed = len(failed_orders(results))
+        if failed:
+            self.logger.error(f"{label}: {failed} of {len(results)} levels failed")
+        else:
+            self.logger.info(f"{label} finished: {len(results)} levels placed", extra={'flush': True})
         return results
 
+    def execute_grid(self, symbol: str, side: str, total_qty: float,
+                     lower_price: float, upper_price: float, grids: int,
+                     use_batch: bool = False):
+        if use_batch:
+            return self.execute_grid_batched(symbol, side, total_qty, lower_price, upper_price, grids)
+        # Levels go out concurrently on the async signed path: the shared python-binance
+        # Client keeps per-request state (client.response) and isn't safe across threads
+        return asyncio.run(self.execute_grid_async(symbol, side, total_qty, lower_price, upper_price, grids))
+
+    async def execute_grid_async(self, symbol: str, side: str, total_qty: float,
+                                 lower_price: float, upper_price: float, grids: int):
+        orders, log_level = self._grid_orders('Grid', symbol, side, total_qty, lower_price, upper_price, grids)
+        # Sign only once a slot is free, so queued requests don't age past Binance's recvWindow
+        slots = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+
+        async def submit(session, params):
+            async with slots:
+                return await self._submit_async(session, 'LIMIT', params, log_level)
+
+        async with self._new_session() as session:
+            results = await asyncio.gather(*(submit(session, params) for params in orders),
+                                           return_exceptions=True)
+        return self._finish_grid('Grid', results)
+
+    def execute_grid_batched(self, symbol: str, side: str, total_qty: float,
+                             lower_price: float, upper_price: float, grids: int):
+        orders, log_level = self._grid_orders('batched Grid', symbol, side, total_qty,
+                                              lower_price, upper_price, grids)
+        orders = [{k: str(v) for k, v in params.items()} for params in orders]
+        results = []
+        for i in range(0, len(orders), _BATCH_LIMIT):
+            chunk = orders[i:i + _BATCH_LIMIT]
+            try:
+                self.logger.log(log_level, f"Placing batch of {len(chunk)} LIMIT orders: {chunk}")
+                responses = self.client.futures_place_batch_order(batchOrders=chunk)
+            except Exception as e:
+                self._log_order_error(e)
+                results.extend([e] * len(chunk))
+                continue
+            # A rejected level comes back as {'code', 'msg'} in its slot; keep going with the rest
+            for order, res in zip(chunk, responses):
+                if 'code' in res:
+                    self.logger.error(f"Batch order at price {order['price']} rejected: {res['code']} - {res.get('msg')}")
+            results.extend(responses)
+        return self._finish_grid('Batched Grid', results)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -190,6 +501,8 @@ def parse_args():
                         help='Upper bound price for Grid')
     parser.add_argument('--grids', type=int,
                         help='Number of grid levels')
+    parser.add_argument('--batch', action='store_true',
+                        help='Submit Grid levels through the batch order endpoint (5 per request)')
     parser.add_argument('--testnet', action='store_true', default=True,
                         help='Use Binance Futures Testnet')
     return parser.parse_args()
@@ -213,8 +526,6 @@ if __name__ == '__main__':
                 stop_price=args.stop_price
             )
         elif args.order_type == 'TWAP':
-            if args.duration is None or args.intervals is None:
-                raise ValueError('TWAP requires --duration and --intervals')
             result = bot.execute_twap(
                 symbol=args.symbol,
                 side=args.side,
@@ -223,18 +534,21 @@ if __name__ == '__main__':
                 intervals=args.intervals
             )
         elif args.order_type == 'GRID':
-            if args.lower_price is None or args.upper_price is None or args.grids is None:
-                raise ValueError('GRID requires --lower-price, --upper-price, and --grids')
             result = bot.execute_grid(
                 symbol=args.symbol,
                 side=args.side,
                 total_qty=args.quantity,
                 lower_price=args.lower_price,
                 upper_price=args.upper_price,
-                grids=args.grids
+                grids=args.grids,
+                use_batch=args.batch
             )
         print("Order response:")
         print(result)
+        failed = failed_orders(result) if isinstance(result, list) else []
+        if failed:
+            print(f"Failed to place {len(failed)} of {len(result)} orders")
+            sys.exit(1)
     except Exception as e:
         print(f"Failed to place order: {e}")
         sys.exit(1)